@@ -0,0 +1,51 @@
+"""Shared fixtures for the root-level COMET test scripts."""
+
+from datetime import date
+
+import pytest
+
+from rostering.models import Person, Config, ProblemInput
+from rostering.sequential_solver import SequentialSolver
+
+
+def comet_fortnight_problem() -> ProblemInput:
+    """11 registrars (9 COMET-eligible) over a fortnight whose first week is a COMET week."""
+    people = [
+        Person(id='reg1', name='Mei Yi', grade='Registrar', wte=0.8, comet_eligible=True),
+        Person(id='reg2', name='David', grade='Registrar', wte=0.8, comet_eligible=True),
+        Person(id='reg3', name='Nikki', grade='Registrar', wte=0.8, comet_eligible=True),
+        Person(id='reg4', name='Reuben', grade='Registrar', wte=0.8, comet_eligible=True),
+        Person(id='reg5', name='Alexander', grade='Registrar', wte=0.6, comet_eligible=False),  # Not eligible
+        Person(id='reg6', name='Abdifatah', grade='Registrar', wte=1.0, comet_eligible=True),
+        Person(id='reg7', name='Hanin', grade='Registrar', wte=0.8, comet_eligible=True),
+        Person(id='reg8', name='Sarah', grade='Registrar', wte=0.6, comet_eligible=False),  # Not eligible
+        Person(id='reg9', name='Manan', grade='Registrar', wte=1.0, comet_eligible=True),
+        Person(id='reg10', name='Mahmoud', grade='Registrar', wte=1.0, comet_eligible=True),
+        Person(id='reg11', name='Reg11', grade='Registrar', wte=1.0, comet_eligible=True),
+    ]
+
+    config = Config(
+        start_date=date(2025, 2, 10),  # Monday
+        end_date=date(2025, 2, 23),    # 14 days
+        bank_holidays=[],
+        comet_on_weeks=[date(2025, 2, 10)],  # First week is COMET week
+        max_day_clinicians=5,
+        ideal_weekday_day_clinicians=4,
+        min_weekday_day_clinicians=3
+    )
+
+    return ProblemInput(config=config, people=people)
+
+
+def solve_comet_fortnight():
+    """Solve the COMET stage of the fortnight problem, returning (problem, result)."""
+    problem = comet_fortnight_problem()
+    solver = SequentialSolver(problem)
+    result = solver.solve_stage("comet", timeout_seconds=60)
+    return problem, result
+
+
+@pytest.fixture(scope="session")
+def comet_fortnight():
+    """One COMET-stage solve shared by every test that only reads the roster."""
+    return solve_comet_fortnight()
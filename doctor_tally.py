@@ -1,9 +1,8 @@
 #!/usr/bin/env python3
 """Generate detailed statistics tally for each doctor from the roster."""
 
+import numpy as np
 import pandas as pd
-import yaml
-import datetime as dt
 import sys
 import os
 from collections import defaultdict
@@ -11,85 +10,108 @@ from collections import defaultdict
 # Add the parent directory to the path so we can import rostering
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from rostering.models import ShiftType, SHIFT_DEFINITIONS
+from rostering.models import SHIFT_DEFINITIONS
 
-def analyze_roster(roster_file="out/full_roster.csv", people_file="data/sample_people.csv"):
-    """Analyze roster and generate doctor statistics."""
+# Column order for the printed and saved tally
+TALLY_COLUMNS = ['name', 'grade', 'wte', 'nights', 'long_days', 'comet_nights', 'comet_days',
+                 'short_days', 'total_hours', 'avg_weekly_hours', 'expected_weekly_hours', 'hours_variance']
+
+# One printed tally row (fields as in TALLY_COLUMNS)
+TALLY_ROW_FORMAT = ("{name:<20} {grade:<10} {wte:<5.1f} "
+                    "{nights:<7} {long_days:<5} {comet_nights:<5} {comet_days:<5} {short_days:<5} "
+                    "{total_hours:<10} {avg_weekly_hours:<10.1f} {expected_weekly_hours:<10.1f} "
+                    "{hours_variance:+10.1f}\n")
+
+# Hours credited per shift code, taken from the shared shift definitions (OFF/LTFT are zero)
+SHIFT_HOURS = pd.Series({shift.value: int(spec["hours"]) for shift, spec in SHIFT_DEFINITIONS.items()})
+
+def load_roster(roster_file):
+    """Read a roster CSV as a days x doctors frame."""
+    # Shift columns are short repeated tokens, so read them straight into categoricals
+    # (column 0 is the date index)
+    return pd.read_csv(roster_file, index_col=0, dtype=defaultdict(lambda: 'category', {0: str}))
+
+def shift_code_matrix(df_roster):
+    """Encode a roster as a days x doctors matrix of SHIFT_HOURS positions (-1 for blanks/untracked shifts)."""
+    columns = []
+    for person_id in df_roster.columns:
+        shifts = df_roster[person_id]
+        if isinstance(shifts.dtype, pd.CategoricalDtype):
+            # Remap the column's own category codes; appending -1 keeps missing (-1) codes at -1
+            lookup = np.append(SHIFT_HOURS.index.get_indexer(shifts.cat.categories), -1)
+            columns.append(lookup[shifts.cat.codes.to_numpy()])
+        else:
+            columns.append(SHIFT_HOURS.index.get_indexer(shifts.to_numpy()))
+    return np.column_stack(columns) if columns else np.empty((len(df_roster), 0), dtype=np.intp)
+
+def analyze_roster(roster_file="out/full_roster.csv", people_file="data/sample_people.csv", df_roster=None):
+    """Analyze roster and generate doctor statistics.
     
-    # Load roster
-    if not os.path.exists(roster_file):
-        print(f"❌ Roster file not found: {roster_file}")
-        print("Run the solver first to generate a roster.")
-        return
+    Pass an already-loaded days x doctors ``df_roster`` to skip reading ``roster_file``.
+    """
     
-    df_roster = pd.read_csv(roster_file, index_col=0)
+    # Load roster
+    if df_roster is None:
+        if not os.path.exists(roster_file):
+            print(f"❌ Roster file not found: {roster_file}")
+            print("Run the solver first to generate a roster.")
+            return
+        
+        df_roster = load_roster(roster_file)
     
-    # Load people data for names and WTE
+    # Load people data for names and WTE (last row wins for a repeated id)
     df_people = pd.read_csv(people_file)
-    people_info = {row['id']: {'name': row['name'], 'wte': row['wte'], 'grade': row['grade']} 
-                   for _, row in df_people.iterrows()}
-    
-    # Calculate statistics for each doctor
-    stats = {}
-    
-    for person_id in df_roster.columns:
-        if person_id not in people_info:
-            continue
-            
-        person_info = people_info[person_id]
-        shifts = df_roster[person_id].tolist()
-        
-        # Count different shift types
-        night_shifts = shifts.count('N_REG') + shifts.count('N_SHO')
-        long_day_shifts = shifts.count('LD_REG') + shifts.count('LD_SHO') 
-        comet_nights = shifts.count('CMN')
-        comet_days = shifts.count('CMD')
-        short_days = shifts.count('SD')
-        
-        # Calculate total hours worked
-        total_hours = 0
-        for shift in shifts:
-            if shift in ['N_REG', 'N_SHO']:
-                total_hours += 13  # Night shifts are 13 hours
-            elif shift in ['LD_REG', 'LD_SHO']:
-                total_hours += 13  # Long day shifts are 13 hours
-            elif shift == 'CMN':
-                total_hours += 12  # COMET night is 12 hours
-            elif shift == 'CMD':
-                total_hours += 12  # COMET day is 12 hours
-            elif shift == 'SD':
-                total_hours += 9   # Short day is 9 hours
-            elif shift in ['CPD', 'TREG', 'TSHO', 'TUNIT', 'IND', 'LEAVE', 'STUDY']:
-                total_hours += 9   # Training/leave days are 9 hours
-        
-        # Calculate average weekly hours
-        total_days = len(shifts)
-        weeks = total_days / 7
-        avg_weekly_hours = total_hours / weeks if weeks > 0 else 0
-        
-        # Adjust for WTE (part-time workers)
-        wte = person_info['wte']
-        expected_weekly_hours = 47 * wte  # Assuming 47 hours full time
-        
-        stats[person_id] = {
-            'name': person_info['name'],
-            'grade': person_info['grade'],
-            'wte': wte,
-            'nights': night_shifts,
-            'long_days': long_day_shifts,
-            'comet_nights': comet_nights,
-            'comet_days': comet_days,
-            'short_days': short_days,
-            'total_hours': total_hours,
-            'avg_weekly_hours': avg_weekly_hours,
-            'expected_weekly_hours': expected_weekly_hours,
-            'hours_variance': avg_weekly_hours - expected_weekly_hours
-        }
+    people = df_people.set_index('id')[['name', 'grade', 'wte']]
+    people = people[~people.index.duplicated(keep='last')]
+    
+    # Only tally roster columns that belong to known doctors
+    df_roster = df_roster.loc[:, df_roster.columns.isin(people.index)]
+    people = people.loc[df_roster.columns]
+    codes = shift_code_matrix(df_roster)
+    
+    # Count every shift type per doctor in one pass (a single bincount over doctor-offset codes),
+    # then weight the counts by shift hours
+    n_types, n_doctors = len(SHIFT_HOURS), codes.shape[1]
+    doctor_idx = np.broadcast_to(np.arange(n_doctors), codes.shape)
+    tracked = codes >= 0
+    shift_counts = np.bincount(doctor_idx[tracked] * n_types + codes[tracked],
+                               minlength=n_doctors * n_types).reshape(n_doctors, n_types).T
+    counts = pd.DataFrame(shift_counts, index=SHIFT_HOURS.index, columns=df_roster.columns)
+    total_hours = pd.Series(SHIFT_HOURS.to_numpy() @ shift_counts, index=df_roster.columns)
+    
+    # Calculate average weekly hours for every doctor at once
+    weeks = len(df_roster) / 7
+    avg_weekly_hours = total_hours / weeks if weeks > 0 else total_hours * 0.0
+    
+    # Adjust for WTE (part-time workers)
+    expected_weekly_hours = 47 * people['wte']  # Assuming 47 hours full time
+    
+    stats = pd.DataFrame({
+        'name': people['name'],
+        'grade': people['grade'],
+        'wte': people['wte'],
+        'nights': counts.loc['N_REG'] + counts.loc['N_SHO'],
+        'long_days': counts.loc['LD_REG'] + counts.loc['LD_SHO'],
+        'comet_nights': counts.loc['CMN'],
+        'comet_days': counts.loc['CMD'],
+        'short_days': counts.loc['SD'],
+        'total_hours': total_hours,
+        'avg_weekly_hours': avg_weekly_hours,
+        'expected_weekly_hours': expected_weekly_hours,
+        'hours_variance': avg_weekly_hours - expected_weekly_hours,
+    }).to_dict(orient='index')
     
     return stats
 
-def print_doctor_tally(stats):
-    """Print formatted doctor statistics."""
+def build_tally_frame(stats):
+    """Convert analyze_roster stats into a tally DataFrame sorted by grade then name."""
+    
+    df = pd.DataFrame.from_dict(stats, orient='index')
+    df.index.name = 'person_id'
+    return df[TALLY_COLUMNS].sort_values(['grade', 'name'])
+
+def print_doctor_tally(tally):
+    """Print formatted doctor statistics from a build_tally_frame DataFrame."""
     
     print("=" * 120)
     print("DOCTOR STATISTICS TALLY")
@@ -100,110 +122,58 @@ def print_doctor_tally(stats):
     print(f"{'Name':<20} {'Grade':<10} {'WTE':<5} {'Nights':<7} {'LDs':<5} {'CMN':<5} {'CMD':<5} {'SDs':<5} {'Total Hrs':<10} {'Avg/Week':<10} {'Expected':<10} {'Variance':<10}")
     print("-" * 120)
     
-    # Sort by grade then name
-    sorted_stats = sorted(stats.items(), key=lambda x: (x[1]['grade'], x[1]['name']))
-    
-    total_nights = 0
-    total_long_days = 0
-    total_comet_nights = 0
-    total_comet_days = 0
-    total_short_days = 0
-    total_hours = 0
-    
-    for person_id, data in sorted_stats:
-        print(f"{data['name']:<20} {data['grade']:<10} {data['wte']:<5.1f} "
-              f"{data['nights']:<7} {data['long_days']:<5} {data['comet_nights']:<5} {data['comet_days']:<5} {data['short_days']:<5} "
-              f"{data['total_hours']:<10} {data['avg_weekly_hours']:<10.1f} {data['expected_weekly_hours']:<10.1f} "
-              f"{data['hours_variance']:+10.1f}")
-        
-        total_nights += data['nights']
-        total_long_days += data['long_days']
-        total_comet_nights += data['comet_nights'] 
-        total_comet_days += data['comet_days']
-        total_short_days += data['short_days']
-        total_hours += data['total_hours']
+    sys.stdout.write("".join(TALLY_ROW_FORMAT.format_map(row) for row in tally.to_dict(orient='records')))
+    
+    totals = tally[['nights', 'long_days', 'comet_nights', 'comet_days', 'short_days', 'total_hours']].sum()
     
     print("-" * 120)
-    print(f"{'TOTALS':<20} {'':<10} {'':<5} {total_nights:<7} {total_long_days:<5} {total_comet_nights:<5} {total_comet_days:<5} {total_short_days:<5} {total_hours:<10}")
+    print(f"{'TOTALS':<20} {'':<10} {'':<5} {totals['nights']:<7} {totals['long_days']:<5} {totals['comet_nights']:<5} "
+          f"{totals['comet_days']:<5} {totals['short_days']:<5} {totals['total_hours']:<10}")
     print()
     
     # Summary statistics
     print("SUMMARY:")
-    print(f"• Total doctors: {len(stats)}")
-    print(f"• Total night shifts: {total_nights}")
-    print(f"• Total long day shifts: {total_long_days}")
-    print(f"• Total COMET nights: {total_comet_nights}")
-    print(f"• Total COMET days: {total_comet_days}")
-    print(f"• Total short day shifts: {total_short_days}")
-    print(f"• Total hours worked: {total_hours}")
+    print(f"• Total doctors: {len(tally)}")
+    print(f"• Total night shifts: {totals['nights']}")
+    print(f"• Total long day shifts: {totals['long_days']}")
+    print(f"• Total COMET nights: {totals['comet_nights']}")
+    print(f"• Total COMET days: {totals['comet_days']}")
+    print(f"• Total short day shifts: {totals['short_days']}")
+    print(f"• Total hours worked: {totals['total_hours']}")
     
     # Fairness analysis
     print("\nFAIRNESS ANALYSIS:")
     
-    # Group by grade for fairness analysis
-    by_grade = defaultdict(list)
-    for data in stats.values():
-        by_grade[data['grade']].append(data)
+    # Min/max/mean per grade in one groupby
+    fairness = tally.groupby('grade', sort=False)[['nights', 'long_days', 'hours_variance']].agg(['min', 'max', 'mean'])
     
-    for grade, doctors in by_grade.items():
-        if not doctors:
-            continue
-            
+    for grade, row in fairness.to_dict(orient='index').items():
         print(f"\n{grade}s:")
-        nights = [d['nights'] for d in doctors]
-        long_days = [d['long_days'] for d in doctors]
-        hours_variance = [d['hours_variance'] for d in doctors]
-        
-        if nights:
-            print(f"  Nights: min={min(nights)}, max={max(nights)}, avg={sum(nights)/len(nights):.1f}")
-        if long_days:
-            print(f"  Long days: min={min(long_days)}, max={max(long_days)}, avg={sum(long_days)/len(long_days):.1f}")
-        if hours_variance:
-            print(f"  Hours variance: min={min(hours_variance):+.1f}, max={max(hours_variance):+.1f}, avg={sum(hours_variance)/len(hours_variance):+.1f}")
+        print(f"  Nights: min={row['nights', 'min']}, max={row['nights', 'max']}, avg={row['nights', 'mean']:.1f}")
+        print(f"  Long days: min={row['long_days', 'min']}, max={row['long_days', 'max']}, avg={row['long_days', 'mean']:.1f}")
+        print(f"  Hours variance: min={row['hours_variance', 'min']:+.1f}, max={row['hours_variance', 'max']:+.1f}, "
+              f"avg={row['hours_variance', 'mean']:+.1f}")
 
-def save_tally_csv(stats, output_file="out/doctor_tally.csv"):
-    """Save tally to CSV file."""
-    
-    # Convert to DataFrame
-    df = pd.DataFrame.from_dict(stats, orient='index')
-    df.index.name = 'person_id'
+def save_tally_csv(tally, output_file="out/doctor_tally.csv"):
+    """Save a build_tally_frame DataFrame to CSV."""
     
-    # Reorder columns
-    columns = ['name', 'grade', 'wte', 'nights', 'long_days', 'comet_nights', 'comet_days', 
-               'short_days', 'total_hours', 'avg_weekly_hours', 'expected_weekly_hours', 'hours_variance']
-    df = df[columns]
-    
-    # Save to CSV
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    df.to_csv(output_file)
+    tally.to_csv(output_file)
     print(f"\n📊 Detailed tally saved to: {output_file}")
 
 if __name__ == "__main__":
+    df_roster = None
+    
     # Check if roster exists
     if not os.path.exists("out/full_roster.csv"):
         print("No roster found. Running solver first...")
         # Import and run the solver
-        from rostering.models import ProblemInput, Person, Config, ConstraintWeights
+        from rostering.models import ProblemInput
+        from rostering.loaders import load_sample_problem
         from rostering.sequential_solver import SequentialSolver
         
         # Load sample data and run solver
-        with open("data/sample_config.yml") as f:
-            cfg = yaml.safe_load(f)
-        config = Config(
-            start_date=dt.date.fromisoformat(str(cfg["start_date"])[:10]),
-            end_date=dt.date.fromisoformat(str(cfg["end_date"])[:10]),
-            bank_holidays=[dt.date.fromisoformat(str(d)[:10]) for d in cfg.get("bank_holidays",[])],
-            comet_on_weeks=[dt.date.fromisoformat(str(d)[:10]) for d in cfg.get("comet_on_weeks",[])],
-        )
-        
-        df = pd.read_csv("data/sample_people.csv")
-        people = []
-        for _,r in df.iterrows():
-            people.append(Person(
-                id=r["id"], name=r["name"], grade=r["grade"],
-                wte=float(r["wte"]), 
-                comet_eligible=bool(r["comet_eligible"]) if str(r["comet_eligible"]).lower() not in ["true","false"] else str(r["comet_eligible"]).lower()=="true",
-            ))
+        people, config = load_sample_problem("data/sample_config.yml", "data/sample_people.csv")
         
         problem = ProblemInput(people=people, config=config)
         solver = SequentialSolver(problem)
@@ -222,8 +192,9 @@ if __name__ == "__main__":
         df_roster.to_csv("out/full_roster.csv")
         print("Solver completed, roster saved.")
     
-    # Analyze the roster
-    stats = analyze_roster()
+    # Analyze the roster (reusing the in-memory one if we just solved it)
+    stats = analyze_roster(df_roster=df_roster)
     if stats:
-        print_doctor_tally(stats)
-        save_tally_csv(stats)
\ No newline at end of file
+        tally = build_tally_frame(stats)
+        print_doctor_tally(tally)
+        save_tally_csv(tally)
\ No newline at end of file
@@ -5,11 +5,57 @@ and suggest locum assignments or alternative doctor selections.
 """
 
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from functools import cached_property
 from enum import Enum
+from bisect import bisect_right
+from operator import attrgetter
 import datetime as dt
+import hashlib
 
-from rostering.models import ProblemInput, Person, ShiftType, SHIFT_DEFINITIONS
+import numpy as np
+
+from rostering.models import ProblemInput, ShiftType, SHIFT_DEFINITIONS
+
+# Hours per shift type, looked up once per assignment when building the hours matrix
+SHIFT_HOURS: Dict[ShiftType, float] = {s: SHIFT_DEFINITIONS[s]["hours"] for s in ShiftType}
+
+NIGHT_SHIFTS = frozenset((ShiftType.NIGHT_REG, ShiftType.NIGHT_SHO, ShiftType.COMET_NIGHT))
+# Shifts that count towards working a weekend: paid hours on a shift that provides cover
+WEEKEND_WORKING_SHIFTS = frozenset(s for s in ShiftType if SHIFT_HOURS[s] > 0 and SHIFT_DEFINITIONS[s]["covers"])
+# Eligibility requirements per shift type
+GRADE_REQ: Dict[ShiftType, Optional[str]] = {s: spec.get("grade_req") for s, spec in SHIFT_DEFINITIONS.items()}
+COMET_REQ_SHIFTS = frozenset(s for s, spec in SHIFT_DEFINITIONS.items() if spec.get("comet_req", False))
+
+# Fixed small-integer codes for shift types in the detector's (person, day) matrices
+SHIFT_TYPES: Tuple[ShiftType, ...] = tuple(ShiftType)
+SHIFT_CODES: Dict[ShiftType, int] = {s: code for code, s in enumerate(SHIFT_TYPES)}
+# Roster shift strings straight to codes (ShiftType members hash like their values)
+CODES_BY_VALUE: Dict[str, int] = {s.value: code for s, code in SHIFT_CODES.items()}
+OFF_CODE = SHIFT_CODES[ShiftType.OFF]
+COMET_NIGHT_CODE = SHIFT_CODES[ShiftType.COMET_NIGHT]
+HOURS_BY_CODE = np.array([SHIFT_HOURS[s] for s in SHIFT_TYPES])
+
+# Classification bits per shift code, gathered once per roster and shared by every check
+WORKING_BIT = 1          # any paid hours
+LONG_BIT = 2             # more than 10 hours
+NIGHT_BIT = 4
+WEEKEND_WORKING_BIT = 8
+CLASS_BY_CODE = np.array([
+    (WORKING_BIT if SHIFT_HOURS[s] > 0 else 0)
+    | (LONG_BIT if SHIFT_HOURS[s] > 10 else 0)
+    | (NIGHT_BIT if s in NIGHT_SHIFTS else 0)
+    | (WEEKEND_WORKING_BIT if s in WEEKEND_WORKING_SHIFTS else 0)
+    for s in SHIFT_TYPES
+], dtype=np.uint8)
+
+
+# Number of distinct rosters whose violations each detector remembers
+VIOLATION_CACHE_SIZE = 64
+
+# Sort rank for each severity level, most severe first
+SEVERITY_RANK: Dict[str, int] = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2}
 
 
 class ViolationType(str, Enum):
@@ -25,7 +71,7 @@ class ViolationType(str, Enum):
     SHIFT_COVERAGE = "shift_coverage"       # Required shift not covered
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstraintViolation:
     """Details of a specific constraint violation."""
     violation_type: ViolationType
@@ -37,9 +83,21 @@ class ConstraintViolation:
     current_value: float  # e.g., 78 hours for 72h rule
     limit_value: float    # e.g., 72 hours for 72h rule
     affected_shifts: List[Tuple[dt.date, ShiftType]]  # Specific shifts causing violation
+    severity_rank: int = field(init=False, repr=False, compare=False)  # From SEVERITY_RANK, for sorting
+    _rest_shifts: Optional[List[Tuple[dt.date, ShiftType]]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.severity_rank = SEVERITY_RANK[self.severity]
+    
+    @property
+    def rest_shifts(self) -> List[Tuple[dt.date, ShiftType]]:
+        """Affected shifts that are not nights, worked out on first use."""
+        if self._rest_shifts is None:
+            self._rest_shifts = [shift for shift in self.affected_shifts if shift[1] not in NIGHT_SHIFTS]
+        return self._rest_shifts
 
 
-@dataclass
+@dataclass(slots=True)
 class AlternativeSolution:
     """Suggested alternative to resolve constraint violations."""
     solution_type: str  # "LOCUM", "SWAP_DOCTOR", "REMOVE_SHIFT", "SPLIT_BLOCK"
@@ -57,6 +115,42 @@ class HardConstraintViolationDetector:
         self.problem = problem
         self.people = {p.id: p for p in problem.people}
         self.days = self._get_days_from_config()
+        self._day_index = {day: i for i, day in enumerate(self.days)}
+        self._person_ids = list(self.people)
+        self._person_rows = {person_id: row for row, person_id in enumerate(self._person_ids)}
+        self._wte = np.array([self.people[person_id].wte for person_id in self._person_ids], dtype=np.float64)
+        # Eligibility attributes as per-person columns, so one date/shift query covers everyone
+        people = [self.people[person_id] for person_id in self._person_ids]
+        self._grades = np.array([person.grade for person in people])
+        self._comet_eligible = np.array([person.comet_eligible for person in people], dtype=bool)
+        # Date windows as ordinals; a missing start/end date leaves that side open
+        self._start_ords = np.array([person.start_date.toordinal() if person.start_date else 0
+                                     for person in people], dtype=np.int64)
+        self._end_ords = np.array([person.end_date.toordinal() if person.end_date else dt.date.max.toordinal()
+                                   for person in people], dtype=np.int64)
+        self._fixed_days_off = np.array([-1 if person.fixed_day_off is None else person.fixed_day_off
+                                         for person in people], dtype=np.int8)
+        # Shift type -> mask of people meeting its grade/COMET requirements, filled on demand
+        self._shift_eligibility: Dict[ShiftType, np.ndarray] = {}
+        # Roster date string -> column in self.days (None if outside the period), kept across calls
+        self._date_columns: Dict[str, Optional[int]] = {}
+        # COMET week Mondays as sorted ordinals, for bisect lookups of the week containing a day
+        self._comet_start_ords = sorted(d.toordinal() for d in problem.config.comet_on_weeks)
+        # (Saturday, Sunday) columns of every complete weekend in the period
+        self._weekend_columns = [(col, col + 1) for col, day in enumerate(self.days[:-1]) if day.weekday() == 5]
+        # Violations of recently checked rosters, keyed by a digest of their codes matrix.
+        # Entries are private copies; callers only ever receive fresh copies of them.
+        self._violation_cache: "OrderedDict[bytes, Tuple[ConstraintViolation, ...]]" = OrderedDict()
+        # Alternative suggestion handler for each violation type that has one
+        self._alternative_handlers = {
+            ViolationType.SHIFT_COVERAGE: self._suggest_coverage_alternatives,
+            ViolationType.MAX_72_HOURS: self._suggest_hours_alternatives,
+            ViolationType.WEEKEND_FREQUENCY: self._suggest_weekend_alternatives,
+            ViolationType.CONSECUTIVE_LONG: self._suggest_consecutive_alternatives,
+            ViolationType.CONSECUTIVE_NIGHTS: self._suggest_consecutive_alternatives,
+            ViolationType.CONSECUTIVE_SHIFTS: self._suggest_consecutive_alternatives,
+            ViolationType.NIGHT_REST: self._suggest_rest_alternatives,
+        }
         
     def _get_days_from_config(self) -> List[dt.date]:
         """Generate list of days for the roster period."""
@@ -80,131 +174,136 @@ class HardConstraintViolationDetector:
         violations = []
         
         # Convert roster to internal format
-        assignments = self._convert_roster_format(roster)
+        codes = self._convert_roster_format(roster)
+        
+        # The period and people are fixed per detector, so the codes alone identify the result
+        key = hashlib.blake2b(codes.tobytes(), digest_size=16).digest()
+        cached = self._violation_cache.get(key)
+        if cached is not None:
+            self._violation_cache.move_to_end(key)
+            return self._copy_violations(cached)
+        
+        # Classify every assignment once; the checks below only read these derived matrices
+        hours = HOURS_BY_CODE[codes]
+        classes = CLASS_BY_CODE[codes]
+        working = (classes & WORKING_BIT).astype(bool)
+        long_shifts = (classes & LONG_BIT).astype(bool)
+        nights = (classes & NIGHT_BIT).astype(bool)
+        weekend_working = (classes & WEEKEND_WORKING_BIT).astype(bool)
         
         # Check each type of hard constraint
-        violations.extend(self._check_72_hour_rule(assignments))
-        violations.extend(self._check_weekend_frequency(assignments))
-        violations.extend(self._check_night_rest_rule(assignments))
-        violations.extend(self._check_consecutive_long_shifts(assignments))
-        violations.extend(self._check_consecutive_nights(assignments))
-        violations.extend(self._check_consecutive_shifts(assignments))
-        violations.extend(self._check_weekly_hours(assignments))
-        violations.extend(self._check_shift_coverage(assignments))
-        
-        return sorted(violations, key=lambda v: v.severity)
+        violations.extend(self._check_72_hour_rule(codes, hours))
+        violations.extend(self._check_weekend_frequency(codes, weekend_working))
+        violations.extend(self._check_night_rest_rule(codes, nights, working))
+        violations.extend(self._check_consecutive_long_shifts(codes, long_shifts))
+        violations.extend(self._check_consecutive_nights(codes, nights))
+        violations.extend(self._check_consecutive_shifts(codes, working))
+        violations.extend(self._check_weekly_hours(codes, hours, working))
+        violations.extend(self._check_shift_coverage(codes))
+        
+        violations.sort(key=attrgetter("severity_rank"))
+        
+        self._violation_cache[key] = tuple(self._copy_violations(violations))
+        if len(self._violation_cache) > VIOLATION_CACHE_SIZE:
+            self._violation_cache.popitem(last=False)
+        return violations
     
-    def _convert_roster_format(self, roster: Dict[str, Dict[str, str]]) -> Dict[str, Dict[dt.date, ShiftType]]:
-        """Convert roster from string format to internal objects."""
-        assignments = {}
+    @staticmethod
+    def _copy_violations(violations) -> List[ConstraintViolation]:
+        """Copy violations so cached ones are never shared with callers (the other fields are immutable)."""
+        return [replace(v, affected_shifts=list(v.affected_shifts)) for v in violations]
+    
+    def _convert_roster_format(self, roster: Dict[str, Dict[str, str]]) -> np.ndarray:
+        """Convert roster from string format to a (person, day) matrix of shift codes.
+        
+        Rows follow self.people and columns self.days. Unassigned days, unknown shift
+        types and dates outside the roster period are left as OFF.
+        """
+        codes = np.full((len(self._person_ids), len(self.days)), OFF_CODE, dtype=np.int8)
         
-        for person_id in self.people.keys():
-            assignments[person_id] = {}
-            
         for date_str, day_assignments in roster.items():
-            date_obj = dt.date.fromisoformat(date_str)
+            if date_str not in self._date_columns:
+                self._date_columns[date_str] = self._day_index.get(dt.date.fromisoformat(date_str))
+            col = self._date_columns[date_str]
+            if col is None:
+                continue
+            
             for person_id, shift_str in day_assignments.items():
-                if person_id in assignments:
-                    try:
-                        shift_type = ShiftType(shift_str)
-                        assignments[person_id][date_obj] = shift_type
-                    except ValueError:
-                        # Handle unknown shift types
-                        assignments[person_id][date_obj] = ShiftType.OFF
-                        
-        return assignments
+                row = self._person_rows.get(person_id)
+                if row is not None:
+                    # Unknown shift types stay OFF
+                    codes[row, col] = CODES_BY_VALUE.get(shift_str, OFF_CODE)
+                    
+        return codes
     
-    def _check_72_hour_rule(self, assignments: Dict[str, Dict[dt.date, ShiftType]]) -> List[ConstraintViolation]:
+    def _check_72_hour_rule(self, codes: np.ndarray,
+                            hours: np.ndarray) -> List[ConstraintViolation]:
         """Check for violations of 72-hour in 168-hour rule."""
         violations = []
+        person_ids = self._person_ids
         
-        for person_id, person_assignments in assignments.items():
+        # Every 7-day window total at once, from a prefix sum over each person's days
+        cumulative = np.zeros((hours.shape[0], hours.shape[1] + 1))
+        np.cumsum(hours, axis=1, out=cumulative[:, 1:])
+        window_hours = cumulative[:, 7:] - cumulative[:, :-7]
+        
+        for row, start_idx in np.argwhere(window_hours > 72):
+            person_id = person_ids[row]
             person = self.people[person_id]
+            week_days = self.days[start_idx:start_idx + 7]
+            total_hours = float(window_hours[row, start_idx])
+            affected_shifts = [(day, SHIFT_TYPES[codes[row, start_idx + offset]])
+                               for offset, day in enumerate(week_days) if hours[row, start_idx + offset] > 0]
             
-            # Check each 7-day window
-            for start_idx in range(len(self.days) - 6):
-                week_days = self.days[start_idx:start_idx + 7]
-                total_hours = 0
-                affected_shifts = []
-                
-                for day in week_days:
-                    if day in person_assignments:
-                        shift = person_assignments[day]
-                        hours = SHIFT_DEFINITIONS.get(shift, {}).get("hours", 0)
-                        if hours > 0:
-                            total_hours += hours
-                            affected_shifts.append((day, shift))
-                
-                if total_hours > 72:
-                    violations.append(ConstraintViolation(
-                        violation_type=ViolationType.MAX_72_HOURS,
-                        person_id=person_id,
-                        person_name=person.name,
-                        date_range=(week_days[0], week_days[-1]),
-                        description=f"{person.name} works {total_hours} hours in 7-day period (max: 72h)",
-                        severity="CRITICAL",
-                        current_value=total_hours,
-                        limit_value=72,
-                        affected_shifts=affected_shifts
-                    ))
+            violations.append(ConstraintViolation(
+                violation_type=ViolationType.MAX_72_HOURS,
+                person_id=person_id,
+                person_name=person.name,
+                date_range=(week_days[0], week_days[-1]),
+                description=f"{person.name} works {total_hours} hours in 7-day period (max: 72h)",
+                severity="CRITICAL",
+                current_value=total_hours,
+                limit_value=72,
+                affected_shifts=affected_shifts
+            ))
         
         return violations
     
-    def _check_weekend_frequency(self, assignments: Dict[str, Dict[dt.date, ShiftType]]) -> List[ConstraintViolation]:
+    def _check_weekend_frequency(self, codes: np.ndarray,
+                                 weekend_working: np.ndarray) -> List[ConstraintViolation]:
         """Check for violations of 1-in-2 weekend frequency rule."""
         violations = []
+        weekends = self._weekend_columns
+        if len(weekends) < 2:
+            return violations
         
-        # Find all weekends
-        weekends = []
-        for day in self.days:
-            if day.weekday() == 5:  # Saturday
-                sunday = day + dt.timedelta(days=1)
-                if sunday in self.days:
-                    weekends.append((day, sunday))
-        
-        working_shifts = [s for s in ShiftType if SHIFT_DEFINITIONS[s]["hours"] > 0 and SHIFT_DEFINITIONS[s]["covers"]]
+        # (person, weekend) mask of weekends with any working day, then consecutive pairs of them
+        saturdays, sundays = (list(cols) for cols in zip(*weekends))
+        worked = weekend_working[:, saturdays] | weekend_working[:, sundays]
         
-        for person_id, person_assignments in assignments.items():
+        for row, i in np.argwhere(worked[:, :-1] & worked[:, 1:]).tolist():
+            person_id = self._person_ids[row]
             person = self.people[person_id]
+            cols = weekends[i] + weekends[i + 1]
             
-            # Check consecutive weekend pairs
-            for i in range(len(weekends) - 1):
-                weekend1_sat, weekend1_sun = weekends[i]
-                weekend2_sat, weekend2_sun = weekends[i + 1]
-                
-                # Check if worked weekend 1
-                weekend1_worked = False
-                weekend1_shifts = []
-                for day in [weekend1_sat, weekend1_sun]:
-                    if day in person_assignments and person_assignments[day] in working_shifts:
-                        weekend1_worked = True
-                        weekend1_shifts.append((day, person_assignments[day]))
-                
-                # Check if worked weekend 2
-                weekend2_worked = False
-                weekend2_shifts = []
-                for day in [weekend2_sat, weekend2_sun]:
-                    if day in person_assignments and person_assignments[day] in working_shifts:
-                        weekend2_worked = True
-                        weekend2_shifts.append((day, person_assignments[day]))
-                
-                # Violation if worked both consecutive weekends
-                if weekend1_worked and weekend2_worked:
-                    violations.append(ConstraintViolation(
-                        violation_type=ViolationType.WEEKEND_FREQUENCY,
-                        person_id=person_id,
-                        person_name=person.name,
-                        date_range=(weekend1_sat, weekend2_sun),
-                        description=f"{person.name} works consecutive weekends (max: 1 in 2)",
-                        severity="CRITICAL",
-                        current_value=2,  # 2 consecutive weekends
-                        limit_value=1,    # max 1 in any 2
-                        affected_shifts=weekend1_shifts + weekend2_shifts
-                    ))
+            # Violation if worked both consecutive weekends
+            violations.append(ConstraintViolation(
+                violation_type=ViolationType.WEEKEND_FREQUENCY,
+                person_id=person_id,
+                person_name=person.name,
+                date_range=(self.days[cols[0]], self.days[cols[-1]]),
+                description=f"{person.name} works consecutive weekends (max: 1 in 2)",
+                severity="CRITICAL",
+                current_value=2,  # 2 consecutive weekends
+                limit_value=1,    # max 1 in any 2
+                affected_shifts=[(self.days[col], SHIFT_TYPES[codes[row, col]])
+                                 for col in cols if weekend_working[row, col]]
+            ))
         
         return violations
     
-    def _check_night_rest_rule(self, assignments: Dict[str, Dict[dt.date, ShiftType]]) -> List[ConstraintViolation]:
+    def _check_night_rest_rule(self, codes: np.ndarray,
+                               nights: np.ndarray, working: np.ndarray) -> List[ConstraintViolation]:
         """Check for violations of 46-hour rest after nights rule.
         
         The rule applies AFTER a block of night shifts ends:
@@ -213,161 +312,148 @@ class HardConstraintViolationDetector:
         - This means first working shift can be 2 days after last night shift
         """
         violations = []
-        night_shifts = [ShiftType.NIGHT_REG, ShiftType.NIGHT_SHO, ShiftType.COMET_NIGHT]
-        working_shifts = [s for s in ShiftType if SHIFT_DEFINITIONS[s]["hours"] > 0]
+        person_ids = self._person_ids
+        
+        # Last night of a block (next day is not a night) followed directly by a working shift.
+        # Only days with a day after tomorrow inside the roster are judged.
+        too_soon = nights[:, :-2] & ~nights[:, 1:-1] & working[:, 1:-1]
         
-        for person_id, person_assignments in assignments.items():
+        for row, i in np.argwhere(too_soon).tolist():
+            person_id = person_ids[row]
             person = self.people[person_id]
+            day, rest_day_1 = self.days[i], self.days[i + 1]
             
-            # Find end of night shift blocks
-            for i, day in enumerate(self.days[:-1]):
-                if day in person_assignments and person_assignments[day] in night_shifts:
-                    # Check if this is the END of a night block
-                    is_end_of_night_block = True
-                    if i + 1 < len(self.days):
-                        next_day = self.days[i + 1]
-                        if next_day in person_assignments and person_assignments[next_day] in night_shifts:
-                            is_end_of_night_block = False  # More nights follow
-                    
-                    if is_end_of_night_block:
-                        # Check if next working shift gives proper 46h rest
-                        # Can work again on day after tomorrow (2 days later)
-                        if i + 2 < len(self.days):
-                            rest_day_1 = self.days[i + 1]  # Should be OFF or rest
-                            if rest_day_1 in person_assignments and person_assignments[rest_day_1] in working_shifts:
-                                # Violation: working shift too soon after night block
-                                violations.append(ConstraintViolation(
-                                    violation_type=ViolationType.NIGHT_REST,
-                                    person_id=person_id,
-                                    person_name=person.name,
-                                    date_range=(day, rest_day_1),
-                                    description=f"{person.name} has insufficient rest after night shift block (required: 46h)",
-                                    severity="CRITICAL",
-                                    current_value=24,  # Less than 46h
-                                    limit_value=46,
-                                    affected_shifts=[(day, person_assignments[day]), (rest_day_1, person_assignments[rest_day_1])]
-                                ))
+            violations.append(ConstraintViolation(
+                violation_type=ViolationType.NIGHT_REST,
+                person_id=person_id,
+                person_name=person.name,
+                date_range=(day, rest_day_1),
+                description=f"{person.name} has insufficient rest after night shift block (required: 46h)",
+                severity="CRITICAL",
+                current_value=24,  # Less than 46h
+                limit_value=46,
+                affected_shifts=[(day, SHIFT_TYPES[codes[row, i]]), (rest_day_1, SHIFT_TYPES[codes[row, i + 1]])]
+            ))
         
         return violations
     
-    def _check_consecutive_long_shifts(self, assignments: Dict[str, Dict[dt.date, ShiftType]]) -> List[ConstraintViolation]:
+    @staticmethod
+    def _find_runs(mask: np.ndarray, longer_than: int = 0) -> Tuple[List[int], List[int], List[int]]:
+        """Locate runs of consecutive True days in a (person, day) mask.
+        
+        Only runs longer than `longer_than` days are returned; people with too few
+        True days to contain such a run are skipped before any run is located.
+        Returns (rows, starts, lengths) as plain ints, ordered by row then start day.
+        """
+        candidates = np.flatnonzero(np.count_nonzero(mask, axis=1) > longer_than)
+        if candidates.size == 0:
+            return [], [], []
+        
+        padded = np.zeros((candidates.size, mask.shape[1] + 2), dtype=np.int8)
+        padded[:, 1:-1] = mask[candidates]
+        edges = np.diff(padded, axis=1)
+        rows, starts = np.nonzero(edges == 1)
+        _, ends = np.nonzero(edges == -1)
+        lengths = ends - starts
+        
+        keep = lengths > longer_than
+        return candidates[rows[keep]].tolist(), starts[keep].tolist(), lengths[keep].tolist()
+    
+    def _check_consecutive_long_shifts(self, codes: np.ndarray,
+                                       long_shifts: np.ndarray) -> List[ConstraintViolation]:
         """Check for violations of max 4 consecutive long shifts rule."""
         violations = []
-        long_shifts = [s for s in ShiftType if SHIFT_DEFINITIONS[s]["hours"] > 10]
+        person_ids = self._person_ids
         
-        for person_id, person_assignments in assignments.items():
+        for row, start, length in zip(*self._find_runs(long_shifts, longer_than=4)):
+            person_id = person_ids[row]
             person = self.people[person_id]
             
-            consecutive_count = 0
-            consecutive_shifts = []
-            
-            for day in self.days:
-                if day in person_assignments and person_assignments[day] in long_shifts:
-                    consecutive_count += 1
-                    consecutive_shifts.append((day, person_assignments[day]))
-                    
-                    if consecutive_count > 4:
-                        violations.append(ConstraintViolation(
-                            violation_type=ViolationType.CONSECUTIVE_LONG,
-                            person_id=person_id,
-                            person_name=person.name,
-                            date_range=(consecutive_shifts[0][0], day),
-                            description=f"{person.name} has {consecutive_count} consecutive long shifts (max: 4)",
-                            severity="CRITICAL",
-                            current_value=consecutive_count,
-                            limit_value=4,
-                            affected_shifts=consecutive_shifts.copy()
-                        ))
-                else:
-                    consecutive_count = 0
-                    consecutive_shifts = []
+            # One violation covering the whole run
+            end = start + length - 1
+            violations.append(ConstraintViolation(
+                violation_type=ViolationType.CONSECUTIVE_LONG,
+                person_id=person_id,
+                person_name=person.name,
+                date_range=(self.days[start], self.days[end]),
+                description=f"{person.name} has {length} consecutive long shifts (max: 4)",
+                severity="CRITICAL",
+                current_value=length,
+                limit_value=4,
+                affected_shifts=[(self.days[col], SHIFT_TYPES[codes[row, col]]) for col in range(start, end + 1)]
+            ))
         
         return violations
     
-    def _check_consecutive_nights(self, assignments: Dict[str, Dict[dt.date, ShiftType]]) -> List[ConstraintViolation]:
+    def _check_consecutive_nights(self, codes: np.ndarray,
+                                  nights: np.ndarray) -> List[ConstraintViolation]:
         """Check for violations of night block rules (max 4, min 2)."""
         violations = []
-        night_shifts = [ShiftType.NIGHT_REG, ShiftType.NIGHT_SHO, ShiftType.COMET_NIGHT]
+        person_ids = self._person_ids
         
-        for person_id, person_assignments in assignments.items():
+        for row, start, length in zip(*self._find_runs(nights)):
+            person_id = person_ids[row]
             person = self.people[person_id]
             
-            consecutive_count = 0
-            consecutive_shifts = []
+            # Check for too many consecutive nights
+            if length > 4:
+                end = start + length - 1
+                violations.append(ConstraintViolation(
+                    violation_type=ViolationType.CONSECUTIVE_NIGHTS,
+                    person_id=person_id,
+                    person_name=person.name,
+                    date_range=(self.days[start], self.days[end]),
+                    description=f"{person.name} has {length} consecutive nights (max: 4)",
+                    severity="CRITICAL",
+                    current_value=length,
+                    limit_value=4,
+                    affected_shifts=[(self.days[col], SHIFT_TYPES[codes[row, col]]) for col in range(start, end + 1)]
+                ))
             
-            for day in self.days:
-                if day in person_assignments and person_assignments[day] in night_shifts:
-                    consecutive_count += 1
-                    consecutive_shifts.append((day, person_assignments[day]))
-                    
-                    # Check for too many consecutive nights
-                    if consecutive_count > 4:
-                        violations.append(ConstraintViolation(
-                            violation_type=ViolationType.CONSECUTIVE_NIGHTS,
-                            person_id=person_id,
-                            person_name=person.name,
-                            date_range=(consecutive_shifts[0][0], day),
-                            description=f"{person.name} has {consecutive_count} consecutive nights (max: 4)",
-                            severity="CRITICAL",
-                            current_value=consecutive_count,
-                            limit_value=4,
-                            affected_shifts=consecutive_shifts.copy()
-                        ))
-                else:
-                    # End of night block - check for single nights
-                    if consecutive_count == 1:
-                        violations.append(ConstraintViolation(
-                            violation_type=ViolationType.CONSECUTIVE_NIGHTS,
-                            person_id=person_id,
-                            person_name=person.name,
-                            date_range=(consecutive_shifts[0][0], consecutive_shifts[0][0]),
-                            description=f"{person.name} has single night shift (min block size: 2)",
-                            severity="HIGH",
-                            current_value=1,
-                            limit_value=2,
-                            affected_shifts=consecutive_shifts.copy()
-                        ))
-                    
-                    consecutive_count = 0
-                    consecutive_shifts = []
+            # Single nights are only judged once a following day shows the block has ended
+            if length == 1 and start + 1 < len(self.days):
+                day = self.days[start]
+                violations.append(ConstraintViolation(
+                    violation_type=ViolationType.CONSECUTIVE_NIGHTS,
+                    person_id=person_id,
+                    person_name=person.name,
+                    date_range=(day, day),
+                    description=f"{person.name} has single night shift (min block size: 2)",
+                    severity="HIGH",
+                    current_value=1,
+                    limit_value=2,
+                    affected_shifts=[(day, SHIFT_TYPES[codes[row, start]])]
+                ))
         
         return violations
     
-    def _check_consecutive_shifts(self, assignments: Dict[str, Dict[dt.date, ShiftType]]) -> List[ConstraintViolation]:
+    def _check_consecutive_shifts(self, codes: np.ndarray,
+                                  working: np.ndarray) -> List[ConstraintViolation]:
         """Check for violations of max 7 consecutive shifts rule."""
         violations = []
-        working_shifts = [s for s in ShiftType if SHIFT_DEFINITIONS[s]["hours"] > 0]
+        person_ids = self._person_ids
         
-        for person_id, person_assignments in assignments.items():
+        for row, start, length in zip(*self._find_runs(working, longer_than=7)):
+            person_id = person_ids[row]
             person = self.people[person_id]
             
-            consecutive_count = 0
-            consecutive_shifts = []
-            
-            for day in self.days:
-                if day in person_assignments and person_assignments[day] in working_shifts:
-                    consecutive_count += 1
-                    consecutive_shifts.append((day, person_assignments[day]))
-                    
-                    if consecutive_count > 7:
-                        violations.append(ConstraintViolation(
-                            violation_type=ViolationType.CONSECUTIVE_SHIFTS,
-                            person_id=person_id,
-                            person_name=person.name,
-                            date_range=(consecutive_shifts[0][0], day),
-                            description=f"{person.name} has {consecutive_count} consecutive shifts (max: 7)",
-                            severity="CRITICAL",
-                            current_value=consecutive_count,
-                            limit_value=7,
-                            affected_shifts=consecutive_shifts.copy()
-                        ))
-                else:
-                    consecutive_count = 0
-                    consecutive_shifts = []
+            end = start + length - 1
+            violations.append(ConstraintViolation(
+                violation_type=ViolationType.CONSECUTIVE_SHIFTS,
+                person_id=person_id,
+                person_name=person.name,
+                date_range=(self.days[start], self.days[end]),
+                description=f"{person.name} has {length} consecutive shifts (max: 7)",
+                severity="CRITICAL",
+                current_value=length,
+                limit_value=7,
+                affected_shifts=[(self.days[col], SHIFT_TYPES[codes[row, col]]) for col in range(start, end + 1)]
+            ))
         
         return violations
     
-    def _check_weekly_hours(self, assignments: Dict[str, Dict[dt.date, ShiftType]]) -> List[ConstraintViolation]:
+    def _check_weekly_hours(self, codes: np.ndarray, hours: np.ndarray,
+                            working: np.ndarray) -> List[ConstraintViolation]:
         """Check for violations of weekly hours constraints (42-47h * WTE).
         
         Only applies to full roster periods (≥20 weeks). During sequential solving
@@ -381,53 +467,37 @@ class HardConstraintViolationDetector:
         if total_weeks < 20:
             return violations
         
-        for person_id, person_assignments in assignments.items():
+        # Totals and expected range over the full period for everyone at once
+        # (OFF and LTFT carry no hours, so summing the hours matrix skips them)
+        totals = hours.sum(axis=1)
+        min_totals = (42 * self._wte * total_weeks).astype(int)
+        max_totals = (48 * self._wte * total_weeks).astype(int)  # Slightly more lenient upper bound
+        
+        # Only flag significant deviations in full roster
+        under = totals < min_totals * 0.9  # 10% tolerance for complexity of scheduling
+        over = totals > max_totals * 1.1   # 10% tolerance
+        
+        for row in np.flatnonzero(under | over).tolist():
+            person_id = self._person_ids[row]
             person = self.people[person_id]
-            
-            total_hours = 0
-            working_shifts = []
-            
-            for day, shift in person_assignments.items():
-                if shift not in [ShiftType.OFF, ShiftType.LTFT]:
-                    hours = SHIFT_DEFINITIONS.get(shift, {}).get("hours", 0)
-                    total_hours += hours
-                    if hours > 0:
-                        working_shifts.append((day, shift))
-            
-            # Calculate expected range over full period
-            min_total = int(42 * person.wte * total_weeks)
-            max_total = int(48 * person.wte * total_weeks)  # Slightly more lenient upper bound
-            avg_weekly = total_hours / total_weeks if total_weeks > 0 else 0
-            
-            # Only flag significant deviations in full roster
-            if total_hours < min_total * 0.9:  # 10% tolerance for complexity of scheduling
-                violations.append(ConstraintViolation(
-                    violation_type=ViolationType.WEEKLY_HOURS,
-                    person_id=person_id,
-                    person_name=person.name,
-                    date_range=(self.days[0], self.days[-1]),
-                    description=f"{person.name} works {avg_weekly:.1f}h/week (min: {42 * person.wte:.1f}h)",
-                    severity="HIGH",
-                    current_value=avg_weekly,
-                    limit_value=42 * person.wte,
-                    affected_shifts=working_shifts
-                ))
-            elif total_hours > max_total * 1.1:  # 10% tolerance
-                violations.append(ConstraintViolation(
-                    violation_type=ViolationType.WEEKLY_HOURS,
-                    person_id=person_id,
-                    person_name=person.name,
-                    date_range=(self.days[0], self.days[-1]),
-                    description=f"{person.name} works {avg_weekly:.1f}h/week (max: {48 * person.wte:.1f}h)",
-                    severity="HIGH",  # Reduced from CRITICAL
-                    current_value=avg_weekly,
-                    limit_value=48 * person.wte,
-                    affected_shifts=working_shifts
-                ))
+            avg_weekly = float(totals[row]) / total_weeks
+            bound, limit = ("min", 42 * person.wte) if under[row] else ("max", 48 * person.wte)
+            violations.append(ConstraintViolation(
+                violation_type=ViolationType.WEEKLY_HOURS,
+                person_id=person_id,
+                person_name=person.name,
+                date_range=(self.days[0], self.days[-1]),
+                description=f"{person.name} works {avg_weekly:.1f}h/week ({bound}: {limit:.1f}h)",
+                severity="HIGH",  # Over-hours reduced from CRITICAL
+                current_value=avg_weekly,
+                limit_value=limit,
+                affected_shifts=[(self.days[col], SHIFT_TYPES[codes[row, col]])
+                                 for col in np.flatnonzero(working[row]).tolist()]
+            ))
         
         return violations
     
-    def _check_shift_coverage(self, assignments: Dict[str, Dict[dt.date, ShiftType]]) -> List[ConstraintViolation]:
+    def _check_shift_coverage(self, codes: np.ndarray) -> List[ConstraintViolation]:
         """Check for days where required shifts are not covered.
         
         For sequential solving, only check coverage relevant to completed stages:
@@ -440,28 +510,23 @@ class HardConstraintViolationDetector:
         
         # Determine what coverage to check based on roster completeness
         # If this is a partial roster (sequential solving), be more lenient
-        total_assigned_shifts = sum(
-            len([s for s in person_assignments.values() if s != ShiftType.OFF])
-            for person_assignments in assignments.values()
-        )
+        total_assigned_shifts = int(np.count_nonzero(codes != OFF_CODE))
         
         # Rough heuristic: if very few shifts assigned, we're in early sequential stages
         is_partial_roster = total_assigned_shifts < (len(self.days) * len(self.people) * 0.3)
         
         if is_partial_roster:
             # Only check COMET night coverage on COMET weeks for sequential solving
-            for day in self.days:
-                is_comet_week = any(
-                    comet_monday <= day <= comet_monday + dt.timedelta(days=6)
-                    for comet_monday in self.problem.config.comet_on_weeks
-                )
+            comet_starts = self._comet_start_ords
+            comet_nights_per_day = np.count_nonzero(codes == COMET_NIGHT_CODE, axis=0).tolist()
+            for col, day in enumerate(self.days):
+                ordinal = day.toordinal()
+                i = bisect_right(comet_starts, ordinal) - 1
+                is_comet_week = i >= 0 and ordinal - comet_starts[i] < 7
                 
                 if is_comet_week:
                     # Check if COMET night is covered
-                    comet_night_count = sum(
-                        1 for person_assignments in assignments.values()
-                        if day in person_assignments and person_assignments[day] == ShiftType.COMET_NIGHT
-                    )
+                    comet_night_count = comet_nights_per_day[col]
                     
                     if comet_night_count == 0:
                         violations.append(ConstraintViolation(
@@ -497,17 +562,12 @@ class HardConstraintViolationDetector:
         """Generate alternative solutions for constraint violations."""
         alternatives = []
         
+        handlers = self._alternative_handlers
+        
         for violation in violations:
-            if violation.violation_type == ViolationType.SHIFT_COVERAGE:
-                alternatives.extend(self._suggest_coverage_alternatives(violation))
-            elif violation.violation_type == ViolationType.MAX_72_HOURS:
-                alternatives.extend(self._suggest_hours_alternatives(violation))
-            elif violation.violation_type == ViolationType.WEEKEND_FREQUENCY:
-                alternatives.extend(self._suggest_weekend_alternatives(violation))
-            elif violation.violation_type in [ViolationType.CONSECUTIVE_LONG, ViolationType.CONSECUTIVE_NIGHTS, ViolationType.CONSECUTIVE_SHIFTS]:
-                alternatives.extend(self._suggest_consecutive_alternatives(violation))
-            elif violation.violation_type == ViolationType.NIGHT_REST:
-                alternatives.extend(self._suggest_rest_alternatives(violation))
+            handler = handlers.get(violation.violation_type)
+            if handler is not None:
+                alternatives.extend(handler(violation))
         
         return sorted(alternatives, key=lambda a: (a.estimated_cost, -a.feasibility_score))
     
@@ -527,16 +587,16 @@ class HardConstraintViolationDetector:
         ))
         
         # Option 2: Find alternative doctor
-        for person_id, person in self.people.items():
-            if self._can_person_work_shift(person, shift_date, shift_type):
-                alternatives.append(AlternativeSolution(
-                    solution_type="SWAP_DOCTOR",
-                    description=f"Assign {person.name} to {shift_type.value} on {shift_date}",
-                    target_person_id=person.id,
-                    target_shifts=[(shift_date, shift_type)],
-                    estimated_cost=0,  # No extra cost
-                    feasibility_score=0.7  # May cause other constraints
-                ))
+        for row in np.flatnonzero(self._people_able_to_work(shift_date, shift_type)).tolist():
+            person = self.people[self._person_ids[row]]
+            alternatives.append(AlternativeSolution(
+                solution_type="SWAP_DOCTOR",
+                description=f"Assign {person.name} to {shift_type.value} on {shift_date}",
+                target_person_id=person.id,
+                target_shifts=[(shift_date, shift_type)],
+                estimated_cost=0,  # No extra cost
+                feasibility_score=0.7  # May cause other constraints
+            ))
         
         return alternatives
     
@@ -611,41 +671,49 @@ class HardConstraintViolationDetector:
         alternatives = []
         
         # Option 1: Remove shifts during rest period
-        rest_shifts = [shift for shift in violation.affected_shifts if shift[1] not in [ShiftType.NIGHT_REG, ShiftType.NIGHT_SHO, ShiftType.COMET_NIGHT]]
+        rest_shifts = violation.rest_shifts
         if rest_shifts:
             alternatives.append(AlternativeSolution(
                 solution_type="REMOVE_SHIFT",
                 description=f"Remove shifts during rest period for {violation.person_name}",
                 target_person_id=violation.person_id,
-                target_shifts=rest_shifts,
+                target_shifts=list(rest_shifts),
                 estimated_cost=len(rest_shifts) * 600,
                 feasibility_score=0.8
             ))
         
         return alternatives
     
-    def _can_person_work_shift(self, person: Person, date: dt.date, shift_type: ShiftType) -> bool:
-        """Check if a person can work a specific shift type on a specific date."""
-        # Basic eligibility checks
-        shift_def = SHIFT_DEFINITIONS.get(shift_type, {})
-        
-        # Grade requirements
-        grade_req = shift_def.get("grade_req")
-        if grade_req and person.grade != grade_req:
-            return False
-        
-        # COMET eligibility
-        if shift_def.get("comet_req", False) and not person.comet_eligible:
-            return False
-        
-        # Start/end date checks
-        if person.start_date and date < person.start_date:
-            return False
-        if person.end_date and date > person.end_date:
-            return False
-        
-        # LTFT day check
-        if person.fixed_day_off is not None and date.weekday() == person.fixed_day_off:
-            return False
-        
-        return True
\ No newline at end of file
+    @cached_property
+    def _availability(self) -> np.ndarray:
+        """(person, day) mask of days inside each person's start/end dates and not their LTFT day."""
+        day_ords = np.array([day.toordinal() for day in self.days], dtype=np.int64)
+        weekdays = np.array([day.weekday() for day in self.days], dtype=np.int8)
+        return ((self._start_ords[:, None] <= day_ords) & (self._end_ords[:, None] >= day_ords)
+                & (self._fixed_days_off[:, None] != weekdays))
+    
+    def _people_eligible_for(self, shift_type: ShiftType) -> np.ndarray:
+        """Mask of people meeting a shift type's grade and COMET requirements, built once per type."""
+        eligible = self._shift_eligibility.get(shift_type)
+        if eligible is None:
+            eligible = np.ones(len(self._person_ids), dtype=bool)
+            grade_req = GRADE_REQ.get(shift_type)
+            if grade_req:
+                eligible &= self._grades == grade_req
+            if shift_type in COMET_REQ_SHIFTS:
+                eligible &= self._comet_eligible
+            self._shift_eligibility[shift_type] = eligible
+        return eligible
+    
+    def _people_able_to_work(self, date: dt.date, shift_type: ShiftType) -> np.ndarray:
+        """Boolean mask over the detector's people of who can work a shift type on a date."""
+        # Grade and COMET rules don't depend on the date, so they come pre-evaluated
+        eligible = self._people_eligible_for(shift_type)
+        
+        # Start/end date checks and LTFT day check
+        col = self._day_index.get(date)
+        if col is not None:
+            return eligible & self._availability[:, col]
+        date_ord = date.toordinal()
+        return (eligible & (self._start_ords <= date_ord) & (self._end_ords >= date_ord)
+                & (self._fixed_days_off != date.weekday()))
@@ -190,10 +190,11 @@ def add_training_constraints(model, x, people, days, config, P, D):
 
 def add_coverage_constraints(model, x, locum_vars, days, config, P, D, reg_ids, sho_ids):
     """Add daily coverage requirements."""
+    bank_holidays = frozenset(config.bank_holidays)
     
     for d_idx, day in enumerate(days):
         is_weekend = day.weekday() >= 5
-        is_bank_holiday = day in config.bank_holidays
+        is_bank_holiday = day in bank_holidays
         is_weekend_or_holiday = is_weekend or is_bank_holiday
         
         # DAILY REQUIREMENTS (every day)
@@ -274,8 +275,9 @@ def soft_objective(problem: ProblemInput, model: cp_model.CpModel, x, locum_vars
     # These are handled by firm constraints and preferences
     
     # Weekday staffing targets (Priority 6)
+    bank_holidays = frozenset(problem.config.bank_holidays)
     for d_idx, day in enumerate(days):
-        if day.weekday() < 5 and day not in problem.config.bank_holidays:
+        if day.weekday() < 5 and day not in bank_holidays:
             # Count total day staff (LD + SD)
             total_day_staff = (
                 sum(x[p, d_idx, ShiftType.LONG_DAY_REG] for p in P) +
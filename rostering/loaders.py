@@ -0,0 +1,107 @@
+"""
+Loaders for the YAML config and people CSV used by the sample scripts and tests.
+Parsed results are cached per file modification time, so repeated loads of the
+same files within one process skip the YAML/CSV parse and model validation.
+Every call returns its own copies, so callers may modify what they get back.
+"""
+
+import datetime as dt
+import os
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import pandas as pd
+import yaml
+
+from rostering.models import Config, Person
+
+DEFAULT_CONFIG_PATH = "data/sample_config.yml"
+DEFAULT_PEOPLE_PATH = "data/sample_people.csv"
+
+# Columns read from the people CSV (optional ones may be missing from the file)
+PEOPLE_COLUMNS = ["id", "name", "grade", "wte", "fixed_day_off", "comet_eligible", "start_date", "end_date"]
+PEOPLE_DTYPES = {"id": str, "name": str, "grade": str, "wte": "float64", "fixed_day_off": "Int64"}
+
+
+def _parse_date(value) -> Optional[dt.date]:
+    """Parse a YAML/CSV date cell, treating blanks as missing."""
+    if value is None or pd.isna(value) or value == "":
+        return None
+    return dt.date.fromisoformat(str(value)[:10])
+
+
+def _parse_date_list(values) -> List[dt.date]:
+    """Parse a YAML list of dates in one vectorised call."""
+    return list(pd.to_datetime([str(v)[:10] for v in values], format="%Y-%m-%d").date)
+
+
+def _parse_bool_cell(value: str) -> bool:
+    """Parse a raw CSV boolean cell; blanks count as False."""
+    return value.strip().lower() in ("true", "1", "yes")
+
+
+def _make_person(row: tuple) -> Person:
+    """Build a Person from a normalised CSV row."""
+    id_, name, grade, wte, fdo, comet, start, end = row
+    return Person(
+        id=id_, name=name, grade=grade,
+        wte=float(wte),
+        fixed_day_off=None if fdo == -1 else fdo,
+        comet_eligible=comet,
+        start_date=start,
+        end_date=end,
+    )
+
+
+@lru_cache(maxsize=4)
+def _load_config(path: str, mtime_ns: int) -> Config:
+    with open(path) as f:
+        cfg = yaml.safe_load(f)
+    return Config(
+        start_date=_parse_date(cfg["start_date"]),
+        end_date=_parse_date(cfg["end_date"]),
+        bank_holidays=_parse_date_list(cfg.get("bank_holidays") or []),
+        comet_on_weeks=_parse_date_list(cfg.get("comet_on_weeks") or []),
+        max_day_clinicians=cfg.get("max_day_clinicians", 5),
+        ideal_weekday_day_clinicians=cfg.get("ideal_weekday_day_clinicians", 4),
+        min_weekday_day_clinicians=cfg.get("min_weekday_day_clinicians", 3),
+    )
+
+
+@lru_cache(maxsize=4)
+def _load_people(path: str, mtime_ns: int) -> Tuple[Person, ...]:
+    # Typed columns are parsed by pandas' C reader; only the boolean needs a converter
+    df = pd.read_csv(
+        path,
+        usecols=lambda col: col in PEOPLE_COLUMNS,
+        dtype=PEOPLE_DTYPES,
+        converters={"comet_eligible": _parse_bool_cell},
+    )
+    if "comet_eligible" not in df:
+        df["comet_eligible"] = False
+    df = df.reindex(columns=PEOPLE_COLUMNS)
+    
+    # Dates are optional columns, so they are converted after the read.
+    # Missing values are filled in bulk (-1 / None) so the row loop needs no isna checks.
+    df["fixed_day_off"] = df["fixed_day_off"].fillna(-1).astype(int)
+    for col in ("start_date", "end_date"):
+        dates = pd.to_datetime(df[col], errors="coerce")
+        df[col] = dates.dt.date.astype(object).where(dates.notna(), None)
+    
+    return tuple(_make_person(row) for row in df.itertuples(index=False, name=None))
+
+
+def load_config(path: str = DEFAULT_CONFIG_PATH) -> Config:
+    """Load a roster Config from a YAML file."""
+    return _load_config(path, os.stat(path).st_mtime_ns).model_copy(deep=True)
+
+
+def load_people(path: str = DEFAULT_PEOPLE_PATH) -> List[Person]:
+    """Load people from a CSV file. Returns new Person objects on every call."""
+    return [person.model_copy(deep=True) for person in _load_people(path, os.stat(path).st_mtime_ns)]
+
+
+def load_sample_problem(config_path: str = DEFAULT_CONFIG_PATH,
+                        people_path: str = DEFAULT_PEOPLE_PATH) -> Tuple[List[Person], Config]:
+    """Load the (people, config) pair used by the sample scripts."""
+    return load_people(people_path), load_config(config_path)
@@ -5,6 +5,7 @@ Allows reviewing and approving each stage before proceeding.
 
 from ortools.sat.python import cp_model
 from typing import Dict, Tuple, Set, List
+from collections import Counter
 import copy
 from datetime import date, timedelta
 
@@ -70,18 +71,15 @@ class SequentialSolveResult:
             return stats
             
         # Count shifts assigned in this stage
-        shift_counts = {}
-        total_assigned = 0
-        
-        for day_roster in self.partial_roster.values():
-            for person_id, shift_str in day_roster.items():
-                if shift_str != ShiftType.OFF.value:
-                    shift_type = ShiftType(shift_str)
-                    shift_counts[shift_type] = shift_counts.get(shift_type, 0) + 1
-                    total_assigned += 1
+        counts = Counter(
+            shift_str
+            for day_roster in self.partial_roster.values()
+            for shift_str in day_roster.values()
+            if shift_str != ShiftType.OFF.value
+        )
                     
-        stats['shift_counts'] = shift_counts
-        stats['total_assigned'] = total_assigned
+        stats['shift_counts'] = {ShiftType(shift_str): count for shift_str, count in counts.items()}
+        stats['total_assigned'] = sum(counts.values())
         stats['days_covered'] = len(self.partial_roster)
         
         return stats
@@ -96,6 +94,7 @@ class SequentialSolver:
         self.people = problem.people
         self.days = get_days_from_config(self.config)
         self.start_date = self.config.start_date  # Add start_date for date arithmetic
+        self.bank_holidays = frozenset(self.config.bank_holidays)  # O(1) holiday checks
         
         # Track assigned shifts across stages
         self.assigned_shifts: Set[Tuple[int, int, ShiftType]] = set()
@@ -105,6 +104,9 @@ class SequentialSolver:
         # Format: {"person_id": {"cmd": count, "cmn": count}}
         self.historical_comet_counts = historical_comet_counts or {}
         
+        # Created on the first hard constraint check and reused so its result cache persists
+        self._violation_detector = None
+        
         # Initialize empty roster
         for day in self.days:
             self.partial_roster[day.isoformat()] = {
@@ -436,7 +438,7 @@ class SequentialSolver:
                 stage=stage_name, 
                 success=False, 
                 message=f"Unknown stage: {stage_name}",
-                partial_roster=self.partial_roster
+                partial_roster=copy.deepcopy(self.partial_roster)
             )
     
     def _solve_comet_nights_stage(self, timeout_seconds: int) -> SequentialSolveResult:
@@ -728,6 +730,7 @@ class SequentialSolver:
         total_comet_nights = len([d for d in self.days if any(start <= d <= end for start, end in comet_week_ranges)])
         
         uncovered_days = []
+        people_by_id = {p.id: p for p in self.people}
         
         for week_start, week_end in comet_week_ranges:
             print(f"\nCOMET Week: {week_start} to {week_end}")
@@ -744,7 +747,8 @@ class SequentialSolver:
                         assigned_doctor_id = [pid for pid, assignment in day_assignments.items() 
                                              if assignment == ShiftType.COMET_NIGHT.value][0]
                         # Find doctor name from ID
-                        doctor_name = next((p.name for p in self.people if p.id == assigned_doctor_id), assigned_doctor_id)
+                        doctor = people_by_id.get(assigned_doctor_id)
+                        doctor_name = doctor.name if doctor else assigned_doctor_id
                         print(f"  {day} ({day.strftime('%A')}): ✓ {doctor_name} ({assigned_doctor_id})")
                     else:
                         print(f"  {day} ({day.strftime('%A')}): ❌ NO COVERAGE")
@@ -1791,7 +1795,7 @@ class SequentialSolver:
         holiday_work = {person.id: 0 for person in self.people}
         
         for day in self.days:
-            if day in self.config.bank_holidays:
+            if day in self.bank_holidays:
                 day_str = day.isoformat()
                 if day_str in self.partial_roster:
                     for person_id, shift in self.partial_roster[day_str].items():
@@ -1810,7 +1814,7 @@ class SequentialSolver:
         # Identify bank holidays that need COMET day coverage
         bank_holiday_indices = []
         for d_idx, day in enumerate(self.days):
-            if day in self.config.bank_holidays:
+            if day in self.bank_holidays:
                 bank_holiday_indices.append(d_idx)
         
         if not bank_holiday_indices:
@@ -1884,7 +1888,7 @@ class SequentialSolver:
         # Find bank holidays that still need Unit long day coverage
         need_long_day_coverage = []
         for d_idx, day in enumerate(self.days):
-            if day in self.config.bank_holidays:
+            if day in self.bank_holidays:
                 day_str = day.isoformat()
                 # Check if day already has COMET day coverage
                 has_comet_day = any(shift == ShiftType.COMET_DAY.value 
@@ -1959,7 +1963,7 @@ class SequentialSolver:
         holiday_work = {person.id: 0 for person in self.people}
         
         for day in self.days:
-            if day in self.config.bank_holidays:
+            if day in self.bank_holidays:
                 day_str = day.isoformat()
                 if day_str in self.partial_roster:
                     for person_id, shift in self.partial_roster[day_str].items():
@@ -1983,7 +1987,7 @@ class SequentialSolver:
         for d_idx, day in enumerate(self.days):
             is_weekday = day.weekday() < 5  # Monday-Friday
             is_weekend = day.weekday() in [5, 6]
-            is_holiday = day in self.config.bank_holidays
+            is_holiday = day in self.bank_holidays
             if is_weekday and not is_weekend and not is_holiday:
                 weekday_days.append(d_idx)
         
@@ -2790,20 +2794,17 @@ class SequentialSolver:
     def get_roster_statistics(self) -> Dict:
         """Get statistics about the current roster state."""
         stats = {}
-        shift_counts = {}
-        total_assigned = 0
         
         # Count shifts by type
-        for day_str, day_assignments in self.partial_roster.items():
-            for person_id, shift_str in day_assignments.items():
-                if shift_str != ShiftType.OFF.value:
-                    if shift_str not in shift_counts:
-                        shift_counts[shift_str] = 0
-                    shift_counts[shift_str] += 1
-                    total_assigned += 1
+        shift_counts = Counter(
+            shift_str
+            for day_assignments in self.partial_roster.values()
+            for shift_str in day_assignments.values()
+            if shift_str != ShiftType.OFF.value
+        )
                     
-        stats['shift_counts'] = shift_counts
-        stats['total_assigned'] = total_assigned
+        stats['shift_counts'] = dict(shift_counts)
+        stats['total_assigned'] = sum(shift_counts.values())
         stats['days_covered'] = len(self.partial_roster)
         
         return stats
@@ -2812,7 +2813,9 @@ class SequentialSolver:
         """Check current roster for hard constraint violations and suggest alternatives."""
         from .constraint_violations import HardConstraintViolationDetector
         
-        detector = HardConstraintViolationDetector(self.problem)
+        if self._violation_detector is None:
+            self._violation_detector = HardConstraintViolationDetector(self.problem)
+        detector = self._violation_detector
         violations = detector.detect_violations(self.partial_roster)
         alternatives = detector.suggest_alternatives(violations)
         
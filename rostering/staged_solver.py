@@ -172,7 +172,7 @@ def add_weekend_priority_constraints(problem, model, x, days, people):
 
 
 # Import required functions from other modules
-from rostering.solver import extract_roster_solution, calculate_summary_stats, create_infeasible_result
+from rostering.solver import extract_roster_solution, calculate_summary_stats
 
 
 def create_infeasible_result(message: str) -> SolveResult:
@@ -3,52 +3,16 @@
 Test script to demonstrate the checkpoint functionality in the sequential solver.
 """
 
-import yaml
-from rostering.models import ProblemInput
+from rostering.models import ProblemInput, ConstraintWeights
+from rostering.loaders import load_sample_problem
 from rostering.sequential_solver import SequentialSolver
 
 
 def test_checkpoints():
     """Test the sequential solver with checkpoints between stages."""
     
-    # Load config same way as test_full_solve.py
-    with open("data/sample_config.yml") as f:
-        cfg = yaml.safe_load(f)
-
-    import pandas as pd
-    import datetime as dt
-    from rostering.models import Config, Person, ConstraintWeights
-    
-    config = Config(
-        start_date=dt.date.fromisoformat(str(cfg["start_date"])[:10]),
-        end_date=dt.date.fromisoformat(str(cfg["end_date"])[:10]),
-        bank_holidays=[dt.date.fromisoformat(str(d)[:10]) for d in cfg.get("bank_holidays",[])],
-        comet_on_weeks=[dt.date.fromisoformat(str(d)[:10]) for d in cfg.get("comet_on_weeks",[])],
-        max_day_clinicians=cfg.get("max_day_clinicians",5),
-        ideal_weekday_day_clinicians=cfg.get("ideal_weekday_day_clinicians",4),
-        min_weekday_day_clinicians=cfg.get("min_weekday_day_clinicians",3),
-    )
-
-    # Load people
-    df = pd.read_csv("data/sample_people.csv")
-    people = []
-    for _,r in df.iterrows():
-        sd = None
-        if not pd.isna(r.get("start_date")):
-            sd = dt.date.fromisoformat(str(r["start_date"])[:10])
-        ed = None
-        if not pd.isna(r.get("end_date")):
-            ed = dt.date.fromisoformat(str(r["end_date"])[:10])
-            
-        people.append(Person(
-            id=r["id"],
-            name=r["name"],
-            grade=r["grade"],
-            wte=r["wte"],
-            comet_eligible=r.get("comet_eligible", False),
-            start_date=sd,
-            end_date=ed
-        ))
+    # Load config and people same way as test_full_solve.py
+    people, config = load_sample_problem("data/sample_config.yml", "data/sample_people.csv")
 
     # Create problem
     problem = ProblemInput(
@@ -89,44 +53,8 @@ def test_checkpoints():
 def test_auto_continue():
     """Test the sequential solver with auto-continue (no user prompts)."""
     
-    # Load config same way as test_full_solve.py
-    with open("data/sample_config.yml") as f:
-        cfg = yaml.safe_load(f)
-
-    import pandas as pd
-    import datetime as dt
-    from rostering.models import Config, Person, ConstraintWeights
-    
-    config = Config(
-        start_date=dt.date.fromisoformat(str(cfg["start_date"])[:10]),
-        end_date=dt.date.fromisoformat(str(cfg["end_date"])[:10]),
-        bank_holidays=[dt.date.fromisoformat(str(d)[:10]) for d in cfg.get("bank_holidays",[])],
-        comet_on_weeks=[dt.date.fromisoformat(str(d)[:10]) for d in cfg.get("comet_on_weeks",[])],
-        max_day_clinicians=cfg.get("max_day_clinicians",5),
-        ideal_weekday_day_clinicians=cfg.get("ideal_weekday_day_clinicians",4),
-        min_weekday_day_clinicians=cfg.get("min_weekday_day_clinicians",3),
-    )
-
-    # Load people
-    df = pd.read_csv("data/sample_people.csv")
-    people = []
-    for _,r in df.iterrows():
-        sd = None
-        if not pd.isna(r.get("start_date")):
-            sd = dt.date.fromisoformat(str(r["start_date"])[:10])
-        ed = None
-        if not pd.isna(r.get("end_date")):
-            ed = dt.date.fromisoformat(str(r["end_date"])[:10])
-            
-        people.append(Person(
-            id=r["id"],
-            name=r["name"],
-            grade=r["grade"],
-            wte=r["wte"],
-            comet_eligible=r.get("comet_eligible", False),
-            start_date=sd,
-            end_date=ed
-        ))
+    # Load config and people same way as test_full_solve.py
+    people, config = load_sample_problem("data/sample_config.yml", "data/sample_people.csv")
 
     # Create problem
     problem = ProblemInput(
@@ -1,41 +1,20 @@
 #!/usr/bin/env python3
 """Test COMET fairness with detailed WTE analysis."""
 
-from datetime import date, timedelta
-from rostering.models import Person, Config, ProblemInput
-from rostering.sequential_solver import SequentialSolver
+from datetime import timedelta
 
-def test_comet_fairness():
-    # Create people with different WTE values
-    people = [
-        Person(id='reg1', name='Mei Yi', grade='Registrar', wte=0.8, comet_eligible=True),
-        Person(id='reg2', name='David', grade='Registrar', wte=0.8, comet_eligible=True),
-        Person(id='reg3', name='Nikki', grade='Registrar', wte=0.8, comet_eligible=True),
-        Person(id='reg4', name='Reuben', grade='Registrar', wte=0.8, comet_eligible=True),
-        Person(id='reg5', name='Alexander', grade='Registrar', wte=0.6, comet_eligible=False),  # Not eligible
-        Person(id='reg6', name='Abdifatah', grade='Registrar', wte=1.0, comet_eligible=True),
-        Person(id='reg7', name='Hanin', grade='Registrar', wte=0.8, comet_eligible=True),
-        Person(id='reg8', name='Sarah', grade='Registrar', wte=0.6, comet_eligible=False),    # Not eligible
-        Person(id='reg9', name='Manan', grade='Registrar', wte=1.0, comet_eligible=True),
-        Person(id='reg10', name='Mahmoud', grade='Registrar', wte=1.0, comet_eligible=True),
-        Person(id='reg11', name='Reg11', grade='Registrar', wte=1.0, comet_eligible=True),
-    ]
-    
-    config = Config(
-        start_date=date(2025, 2, 10),  # Monday
-        end_date=date(2025, 2, 23),    # 14 days
-        bank_holidays=[],
-        comet_on_weeks=[date(2025, 2, 10)],  # First week is COMET week
-        max_day_clinicians=5,
-        ideal_weekday_day_clinicians=4,
-        min_weekday_day_clinicians=3
-    )
+def test_comet_fairness(comet_fortnight):
+    problem, result = comet_fortnight
+    people, config = problem.people, problem.config
     
     # Calculate expected distribution
     eligible_people = [p for p in people if p.comet_eligible]
     total_wte = sum(p.wte for p in eligible_people)
     total_shifts = 7  # 7 days in COMET week
     
+    # WTE-proportional share of the COMET week, computed once and reused below
+    expected_share = {p.id: (p.wte / total_wte) * total_shifts for p in eligible_people}
+    
     print("WTE-Adjusted Expected Distribution:")
     print(f"Total COMET-eligible WTE: {total_wte}")
     print(f"Total CMD shifts needed: {total_shifts}")
@@ -43,8 +22,8 @@ def test_comet_fairness():
     print()
     
     for person in eligible_people:
-        expected_cmd_float = (person.wte / total_wte) * total_shifts
-        expected_cmn_float = (person.wte / total_wte) * total_shifts
+        expected_cmd_float = expected_share[person.id]
+        expected_cmn_float = expected_share[person.id]
         
         # Show both float and adjusted calculation
         expected_cmd = max(1, int(expected_cmd_float)) if expected_cmd_float >= 0.5 else int(expected_cmd_float)
@@ -54,11 +33,6 @@ def test_comet_fairness():
     
     print()
     
-    # Run solver
-    problem = ProblemInput(config=config, people=people)
-    solver = SequentialSolver(problem)
-    result = solver.solve_stage("comet", timeout_seconds=60)
-    
     print(f"COMET result: {result.success} - {result.message}")
     
     if result.success:
@@ -89,8 +63,8 @@ def test_comet_fairness():
             current_day += timedelta(days=1)
         
         for person in eligible_people:
-            expected_cmd = int((person.wte / total_wte) * total_shifts)
-            expected_cmn = int((person.wte / total_wte) * total_shifts)
+            expected_cmd = int(expected_share[person.id])
+            expected_cmn = int(expected_share[person.id])
             actual_cmd = cmd_counts[person.name]
             actual_cmn = cmn_counts[person.name]
             weekend_work = weekend_counts[person.name]
@@ -128,4 +102,5 @@ def test_comet_fairness():
             print("✅ No CMD→CMN violations")
 
 if __name__ == "__main__":
-    test_comet_fairness()
\ No newline at end of file
+    from conftest import solve_comet_fortnight
+    test_comet_fairness(solve_comet_fortnight())
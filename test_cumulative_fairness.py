@@ -2,44 +2,17 @@
 """Test cumulative COMET fairness with deficit tracking."""
 
 from datetime import date, timedelta
-from rostering.models import Person, Config, ProblemInput
 from rostering.sequential_solver import SequentialSolver
 
-def test_cumulative_fairness():
+def test_cumulative_fairness(comet_fortnight):
     """Test fairness system with historical COMET counts."""
     
-    # Create 9 COMET-eligible people
-    people = [
-        Person(id='reg1', name='Mei Yi', grade='Registrar', wte=0.8, comet_eligible=True),
-        Person(id='reg2', name='David', grade='Registrar', wte=0.8, comet_eligible=True),
-        Person(id='reg3', name='Nikki', grade='Registrar', wte=0.8, comet_eligible=True),
-        Person(id='reg4', name='Reuben', grade='Registrar', wte=0.8, comet_eligible=True),
-        Person(id='reg5', name='Alexander', grade='Registrar', wte=0.6, comet_eligible=False),  # Not eligible
-        Person(id='reg6', name='Abdifatah', grade='Registrar', wte=1.0, comet_eligible=True),
-        Person(id='reg7', name='Hanin', grade='Registrar', wte=0.8, comet_eligible=True),
-        Person(id='reg8', name='Sarah', grade='Registrar', wte=0.6, comet_eligible=False),  # Not eligible
-        Person(id='reg9', name='Manan', grade='Registrar', wte=1.0, comet_eligible=True),
-        Person(id='reg10', name='Mahmoud', grade='Registrar', wte=1.0, comet_eligible=True),
-        Person(id='reg11', name='Reg11', grade='Registrar', wte=1.0, comet_eligible=True),
-    ]
-    
-    config = Config(
-        start_date=date(2025, 2, 10),  # Monday
-        end_date=date(2025, 2, 23),    # 14 days
-        bank_holidays=[],
-        comet_on_weeks=[date(2025, 2, 10)],  # First week is COMET week
-        max_day_clinicians=5,
-        ideal_weekday_day_clinicians=4,
-        min_weekday_day_clinicians=3
-    )
+    problem, result = comet_fortnight
+    people, config = problem.people, problem.config
     
     # Test 1: No historical data (first roster period)
     print("=== Test 1: First roster period (no historical data) ===")
     
-    problem = ProblemInput(config=config, people=people)
-    solver = SequentialSolver(problem, historical_comet_counts=None)
-    
-    result = solver.solve_stage("comet", timeout_seconds=60)
     print(f"Result: {result.success} - {result.message}")
     
     if result.success:
@@ -145,4 +118,5 @@ def test_cumulative_fairness():
             print(f"  {name}: {counts['cmd']} CMD + {counts['cmn']} CMN = {total} total (historical: {historical_total})")
 
 if __name__ == "__main__":
-    test_cumulative_fairness()
\ No newline at end of file
+    from conftest import solve_comet_fortnight
+    test_cumulative_fairness(solve_comet_fortnight())
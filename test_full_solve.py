@@ -1,47 +1,17 @@
 #!/usr/bin/env python3
 """Test script to run full sequential solver and check for constraint violations."""
 
-import yaml, pandas as pd, datetime as dt, sys, os
+import pandas as pd, sys, os
 
 # Add the parent directory to the path so we can import rostering
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from rostering.models import ProblemInput, Person, Config, ConstraintWeights, ShiftType
+from rostering.models import ProblemInput, ConstraintWeights, ShiftType
+from rostering.loaders import load_sample_problem
 from rostering.sequential_solver import SequentialSolver
 
-# Load config
-with open("data/sample_config.yml") as f:
-    cfg = yaml.safe_load(f)
-
-config = Config(
-    start_date=dt.date.fromisoformat(str(cfg["start_date"])[:10]),
-    end_date=dt.date.fromisoformat(str(cfg["end_date"])[:10]),
-    bank_holidays=[dt.date.fromisoformat(str(d)[:10]) for d in cfg.get("bank_holidays",[])],
-    comet_on_weeks=[dt.date.fromisoformat(str(d)[:10]) for d in cfg.get("comet_on_weeks",[])],
-    max_day_clinicians=cfg.get("max_day_clinicians",5),
-    ideal_weekday_day_clinicians=cfg.get("ideal_weekday_day_clinicians",4),
-    min_weekday_day_clinicians=cfg.get("min_weekday_day_clinicians",3),
-)
-
-# Load people
-df = pd.read_csv("data/sample_people.csv")
-people = []
-for _,r in df.iterrows():
-    sd = None
-    if isinstance(r.get("start_date"), str) and r.get("start_date"):
-        sd = dt.date.fromisoformat(r["start_date"])
-    fdo = None
-    if not pd.isna(r.get("fixed_day_off")):
-        try:
-            fdo = int(r["fixed_day_off"])
-        except Exception:
-            fdo = None
-    people.append(Person(
-        id=r["id"], name=r["name"], grade=r["grade"],
-        wte=float(r["wte"]), fixed_day_off=fdo,
-        comet_eligible=bool(r["comet_eligible"]) if str(r["comet_eligible"]).lower() not in ["true","false"] else str(r["comet_eligible"]).lower()=="true",
-        start_date=sd
-    ))
+# Load config and people
+people, config = load_sample_problem("data/sample_config.yml", "data/sample_people.csv")
 
 problem = ProblemInput(people=people, config=config, weights=ConstraintWeights())
 
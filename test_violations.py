@@ -3,8 +3,9 @@
 Test constraint detection with a scenario that SHOULD trigger violations.
 """
 
+import copy
 from datetime import date
-from rostering.constraint_violations import HardConstraintViolationDetector
+from rostering.constraint_violations import HardConstraintViolationDetector, ViolationType
 from rostering.models import Person, ProblemInput, Config
 
 def test_should_have_violations():
@@ -67,6 +68,56 @@ def test_should_have_violations():
     
     return len(critical_violations)
 
+def test_long_night_block_is_one_violation():
+    """A night block past the limit is reported once, covering the whole block."""
+    doctor = Person(id="test_dr", name="Dr. Test", grade="Registrar", wte=1.0, comet_eligible=True)
+    config = Config(
+        start_date=date(2026, 2, 9),
+        end_date=date(2026, 2, 22),
+        comet_on_weeks=[],
+        bank_holidays=[]
+    )
+    problem = ProblemInput(people=[doctor], config=config)
+    
+    # Six nights in a row (Mon-Sat), then off
+    assignments = {f"2026-02-{day:02d}": {"test_dr": "N_REG"} for day in range(9, 15)}
+    
+    violations = HardConstraintViolationDetector(problem).detect_violations(assignments)
+    night_blocks = [v for v in violations if v.violation_type == ViolationType.CONSECUTIVE_NIGHTS]
+    
+    assert len(night_blocks) == 1
+    assert night_blocks[0].current_value == 6
+    assert night_blocks[0].date_range == (date(2026, 2, 9), date(2026, 2, 14))
+    assert len(night_blocks[0].affected_shifts) == 6
+
+def test_repeated_roster_results_are_independent():
+    """Re-checking a roster gives equal, unshared results; a changed roster is re-checked."""
+    doctor = Person(id="test_dr", name="Dr. Test", grade="Registrar", wte=1.0, comet_eligible=True)
+    config = Config(
+        start_date=date(2026, 2, 9),
+        end_date=date(2026, 2, 22),
+        comet_on_weeks=[],
+        bank_holidays=[]
+    )
+    detector = HardConstraintViolationDetector(ProblemInput(people=[doctor], config=config))
+    
+    # Six nights in a row (Mon-Sat)
+    assignments = {f"2026-02-{day:02d}": {"test_dr": "N_REG"} for day in range(9, 15)}
+    first = detector.detect_violations(assignments)
+    expected = copy.deepcopy(first)
+    second = detector.detect_violations(assignments)
+    assert first and second == expected
+    
+    # Editing returned violations must not leak into later results for the same roster
+    for violations in (first, second):
+        violations[0].affected_shifts.clear()
+        violations[0].description = "edited"
+    assert detector.detect_violations(assignments) == expected
+    
+    # Breaking the block into two nights fixes it, so nothing stale is returned
+    assignments = {f"2026-02-{day:02d}": {"test_dr": "N_REG"} for day in (9, 10)}
+    assert detector.detect_violations(assignments) == []
+
 if __name__ == "__main__":
     violations_found = test_should_have_violations()
     print(f"\nConstraint detection is {'working correctly' if violations_found == 1 else 'still has issues'}")
\ No newline at end of file
@@ -0,0 +1,54 @@
+import datetime as dt
+import os
+
+from rostering.loaders import load_config, load_people
+
+CONFIG_YAML = """\
+start_date: 2026-01-05
+end_date: 2026-01-18
+bank_holidays: [2026-01-12]
+comet_on_weeks: [2026-01-05]
+"""
+
+PEOPLE_CSV = """\
+id,name,grade,wte,fixed_day_off,comet_eligible,start_date
+r1,Reg One,Registrar,1.0,,True,
+s1,SHO One,SHO,0.8,4,False,2026-01-07
+"""
+
+
+def write(path, text, mtime_ns):
+    path.write_text(text)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_loads_are_independent_copies(tmp_path):
+    config_path, people_path = tmp_path / "config.yml", tmp_path / "people.csv"
+    write(config_path, CONFIG_YAML, 1_000_000_000_000_000_000)
+    write(people_path, PEOPLE_CSV, 1_000_000_000_000_000_000)
+
+    config = load_config(str(config_path))
+    people = load_people(str(people_path))
+    assert config.bank_holidays == [dt.date(2026, 1, 12)]
+    assert [p.id for p in people] == ["r1", "s1"]
+    assert people[1].fixed_day_off == 4 and people[1].start_date == dt.date(2026, 1, 7)
+
+    # Changes to loaded objects must not reach later loads of the same files
+    config.bank_holidays.append(dt.date(2026, 1, 13))
+    people[0].name = "Changed"
+    assert load_config(str(config_path)).bank_holidays == [dt.date(2026, 1, 12)]
+    assert load_people(str(people_path))[0].name == "Reg One"
+    assert load_people(str(people_path))[0] is not load_people(str(people_path))[0]
+
+
+def test_reloads_when_file_changes(tmp_path):
+    config_path, people_path = tmp_path / "config.yml", tmp_path / "people.csv"
+    write(config_path, CONFIG_YAML, 1_000_000_000_000_000_000)
+    write(people_path, PEOPLE_CSV, 1_000_000_000_000_000_000)
+    assert load_config(str(config_path)).bank_holidays == [dt.date(2026, 1, 12)]
+    assert len(load_people(str(people_path))) == 2
+
+    write(config_path, CONFIG_YAML.replace("[2026-01-12]", "[]"), 1_000_000_000_000_000_001)
+    write(people_path, PEOPLE_CSV + "r2,Reg Two,Registrar,1.0,,False,\n", 1_000_000_000_000_000_001)
+    assert load_config(str(config_path)).bank_holidays == []
+    assert [p.id for p in load_people(str(people_path))] == ["r1", "s1", "r2"]